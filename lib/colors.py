@@ -2,6 +2,11 @@
 Terminal color output utilities
 """
 
+import sys
+
+# ANSI escapes only make sense on a terminal; cron/pipe output stays plain
+_COLOR_ENABLED = sys.stdout is not None and sys.stdout.isatty()
+
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -15,24 +20,41 @@ class Colors:
     @staticmethod
     def colored(text: str, color: str) -> str:
         """Apply color to text"""
-        return f"{color}{text}{Colors.NC}"
+        if not _COLOR_ENABLED:
+            return text
+        return color + text + Colors.NC
 
     @classmethod
     def error(cls, text: str) -> str:
         """Red error message"""
-        return cls.colored(f"❌ {text}", cls.RED)
+        return _ERROR_PREFIX + text + _SUFFIX
 
     @classmethod
     def success(cls, text: str) -> str:
         """Green success message"""
-        return cls.colored(f"✓ {text}", cls.GREEN)
+        return _SUCCESS_PREFIX + text + _SUFFIX
 
     @classmethod
     def warning(cls, text: str) -> str:
         """Yellow warning message"""
-        return cls.colored(f"⚠ {text}", cls.YELLOW)
+        return _WARNING_PREFIX + text + _SUFFIX
 
     @classmethod
     def info(cls, text: str) -> str:
         """Cyan info message"""
-        return cls.colored(text, cls.CYAN)
+        return _INFO_PREFIX + text + _SUFFIX
+
+
+# Prefix/suffix pairs built once so the helpers are plain concatenations
+if _COLOR_ENABLED:
+    _ERROR_PREFIX = Colors.RED + "❌ "
+    _SUCCESS_PREFIX = Colors.GREEN + "✓ "
+    _WARNING_PREFIX = Colors.YELLOW + "⚠ "
+    _INFO_PREFIX = Colors.CYAN
+    _SUFFIX = Colors.NC
+else:
+    _ERROR_PREFIX = "❌ "
+    _SUCCESS_PREFIX = "✓ "
+    _WARNING_PREFIX = "⚠ "
+    _INFO_PREFIX = ""
+    _SUFFIX = ""
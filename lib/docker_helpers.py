@@ -3,8 +3,13 @@ Docker Helper Functions
 Centralized functions for Docker container operations (DRY refactoring)
 """
 
+import io
+import os
+import select
+import shlex
 import subprocess
-from typing import List, Tuple
+import time
+from typing import List, Optional, Tuple
 
 
 def is_container_running(container_name: str = 'misp-misp-core-1',
@@ -258,6 +263,132 @@ def copy_to_container(container_name: str,
         return False, str(e)
 
 
+class DockerShell:
+    """
+    Persistent shell inside a container for running many short commands
+
+    Every `docker exec` pays the container-entry overhead again; commands
+    written to one long-running `sh` skip it. The shell dies with the
+    container, so close it before restarting the container and open a new
+    one afterwards.
+
+    Args:
+        container_name: Name of container (default: misp-misp-core-1)
+
+    Example:
+        >>> with DockerShell() as shell:
+        >>>     code, out, err = shell.run(['ls', '/var/www/MISP'])
+    """
+
+    _RC_MARKER = '__DOCKER_SHELL_RC__'
+    _END_MARKER = '__DOCKER_SHELL_END__'
+
+    def __init__(self, container_name: str = 'misp-misp-core-1'):
+        self.container_name = container_name
+        self._proc: Optional[subprocess.Popen] = None
+        # Each command's stderr is parked here so it can be replayed on stdout
+        self._err_file = f'/tmp/.docker-shell-{os.getpid()}.err'
+
+    def __enter__(self) -> 'DockerShell':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _start(self):
+        self._proc = subprocess.Popen(
+            ['sudo', 'docker', 'exec', '-i', self.container_name, 'sh'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+
+    def close(self):
+        """Exit the shell (removing its stderr file) and wait for it"""
+        if self._proc is None:
+            return
+        try:
+            self._proc.stdin.write(f"rm -f {self._err_file}\n")
+            self._proc.stdin.close()
+            self._proc.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            self._proc.kill()
+            self._proc.wait()
+        self._proc = None
+
+    def run(self, command: List[str], timeout: int = 30) -> Tuple[int, str, str]:
+        """
+        Execute command in the shell (started on first use)
+
+        Args:
+            command: Command to execute as list (quoted for sh, so it runs
+                exactly like `docker exec` would run it)
+            timeout: Command timeout in seconds
+
+        Returns:
+            Tuple of (returncode, stdout, stderr), like exec_in_container
+        """
+        if self._proc is None:
+            self._start()
+
+        # stdout, then the exit status, then the replayed stderr arrive in
+        # order on the one pipe; the extra echo ends output lacking a newline
+        script = (
+            f"{{ {shlex.join(command)}; }} </dev/null 2>{self._err_file}; rc=$?; "
+            f"echo; echo \"{self._RC_MARKER} $rc\"; "
+            f"cat {self._err_file}; echo; echo {self._END_MARKER}\n"
+        )
+
+        # Read against a deadline rather than waiting for EOF: killing sudo
+        # doesn't reach its docker exec child, which keeps the pipe open
+        deadline = time.monotonic() + timeout
+        end = f"\n{self._END_MARKER}\n".encode()
+        fd = self._proc.stdout.fileno()
+        output = bytearray()
+        timed_out = False
+        try:
+            self._proc.stdin.write(script)
+            self._proc.stdin.flush()
+
+            while not output.endswith(end):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                    timed_out = True
+                    break
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                output += chunk
+        except OSError:
+            pass
+
+        returncode = None
+        out_lines = []
+        err_lines = []
+        if output.endswith(end):
+            lines = io.StringIO(output.decode('utf-8', 'replace'), newline=None)
+            for line in lines:
+                if line.startswith(self._RC_MARKER):
+                    returncode = int(line.split()[1])
+                    break
+                out_lines.append(line)
+            for line in lines:
+                if line.rstrip('\n') == self._END_MARKER:
+                    break
+                err_lines.append(line)
+
+        if returncode is None:
+            if timed_out:
+                # sudo relays SIGTERM (not SIGKILL) to docker exec
+                self._proc.terminate()
+            self.close()
+            return -1, "", "Command timed out" if timed_out else "Docker shell exited"
+
+        # Drop the newline added by the extra echo
+        return returncode, ''.join(out_lines)[:-1], ''.join(err_lines)[:-1]
+
+
 # Usage examples for documentation
 if __name__ == "__main__":
     print("Docker Helpers - Usage Examples")
@@ -35,7 +35,7 @@ def setup_logging() -> logging.Logger:
         sys.exit(1)
 
     # Use centralized JSON logger for file logging
-    # This creates JSON logs in /opt/misp/logs/misp-install-{timestamp}.log
+    # This creates JSON logs in /opt/misp/logs/misp-install.log
     misp_logger = get_misp_logger('misp-install', 'misp:install')
 
     # Get the underlying Python logger for compatibility
@@ -43,7 +43,7 @@ def setup_logging() -> logging.Logger:
 
     # The centralized logger already has file + console handlers
     # Just inform user where logs are stored
-    logger.info(Colors.info("📝 JSON Logs: /opt/misp/logs/misp-install-{timestamp}.log"))
+    logger.info(Colors.info("📝 JSON Logs: /opt/misp/logs/misp-install.log"))
 
     return logger
 
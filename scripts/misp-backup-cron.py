@@ -76,7 +76,7 @@ def setup_logging() -> logging.Logger:
     """Setup centralized logging"""
     misp_logger = get_logger('misp-backup-cron', 'misp:backup_cron')
     logger = misp_logger.logger
-    logger.info("📝 JSON Logs: /opt/misp/logs/misp-backup-cron-{timestamp}.log")
+    logger.info("📝 JSON Logs: /opt/misp/logs/misp-backup-cron.log")
     return logger
 
 logger = setup_logging()
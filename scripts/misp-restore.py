@@ -48,7 +48,7 @@ def setup_logging() -> logging.Logger:
     misp_logger = get_logger('misp-restore', 'misp:restore')
     # Get the underlying Python logger for compatibility
     logger = misp_logger.logger
-    logger.info("📝 JSON Logs: /opt/misp/logs/misp-restore-{timestamp}.log")
+    logger.info("📝 JSON Logs: /opt/misp/logs/misp-restore.log")
     return logger
 
 logger = setup_logging()
@@ -593,6 +593,12 @@ def main():
         help='Skip creating pre-restore backup'
     )
 
+    parser.add_argument(
+        '--yes',
+        action='store_true',
+        help='Confirm the restore without prompting (for automation)'
+    )
+
     args = parser.parse_args()
 
     print_banner()
@@ -669,7 +675,14 @@ def main():
         logger.info(f"Restore database: {not args.skip_database}")
         logger.info(f"Create pre-restore backup: {not args.skip_backup}")
 
-        confirm = input("\nProceed with restore? Type 'YES' to continue: ")
+        if args.yes:
+            confirm = 'YES'
+            logger.info("--yes flag set, proceeding without confirmation")
+        elif not sys.stdin.isatty():
+            logger.error(Colors.error("No terminal available for confirmation. Re-run with --yes to restore non-interactively."))
+            sys.exit(1)
+        else:
+            confirm = input("\nProceed with restore? Type 'YES' to continue: ")
         if confirm != 'YES':
             logger.info("Restore cancelled.")
             sys.exit(0)
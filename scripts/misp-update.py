@@ -16,15 +16,13 @@ Features:
 """
 
 import argparse
-import json
 import logging
 import os
 import subprocess
 import sys
-import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Optional, Sequence
 
 # Check Python version
 
@@ -33,8 +31,6 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 # Import centralized logger
 # Import centralized Colors class
-import contextlib
-
 from lib.colors import Colors
 from misp_logger import get_logger
 
@@ -45,6 +41,26 @@ from misp_logger import get_logger
 MISP_DIR = Path('/opt/misp')
 BACKUP_DIR = Path.home() / 'misp-backups'
 
+# Version check cache for repeated --check-only runs (e.g. tight cron schedules)
+UPDATE_CACHE_FILE = MISP_DIR / 'logs' / '.update-cache.json'
+UPDATE_CACHE_TTL = 900  # 15 minutes
+
+# docker compose invocation shared by every container command
+COMPOSE_PREFIX = ('sudo', 'docker', 'compose')
+
+# Decorative output is skipped under cron/pipes to keep log records short
+_is_tty = sys.stdout.isatty()
+
+# Static startup banner, built once at import
+BANNER_STR = Colors.info("\n".join([
+    "\n╔" + "=" * 48 + "╗",
+    "║" + " " * 48 + "║",
+    "║" + "     MISP Update Tool v2.0".center(48) + "║",
+    "║" + "     tKQB Enterprises Edition".center(48) + "║",
+    "║" + " " * 48 + "║",
+    "╚" + "=" * 48 + "╝\n",
+]))
+
 # ==========================================
 # Logging Setup
 # ==========================================
@@ -54,7 +70,7 @@ def setup_logging() -> logging.Logger:
     try:
         misp_logger = get_logger('misp-update', 'misp:update')
         logger = misp_logger.logger
-        print(Colors.info("📝 JSON Logs: /opt/misp/logs/misp-update-{timestamp}.log"))
+        print(Colors.info("📝 JSON Logs: /opt/misp/logs/misp-update.log"))
         return logger
     except Exception as e:
         print(Colors.warning(f"Could not setup centralized logging: {e}"))
@@ -69,7 +85,9 @@ def setup_logging() -> logging.Logger:
         logger.addHandler(handler)
         return logger
 
-logger = setup_logging()
+# Placeholder until main() has parsed arguments; --help/--version exit
+# before any log file is created.
+logger = logging.getLogger('misp-update')
 
 # ==========================================
 # Version Information
@@ -96,14 +114,20 @@ class MISPUpdateManager:
         self.force = force
         self.backup_path: Optional[Path] = None
 
-    def run_command(self, cmd: List[str], check: bool = True, capture_output: bool = False, cwd: Optional[Path] = None) -> subprocess.CompletedProcess:
-        """Run a shell command with logging"""
+    def run_command(self, cmd: Sequence[str], check: bool = True, capture_output: bool = False,
+                    cwd: Optional[Path] = None) -> subprocess.CompletedProcess:
+        """Run a shell command with logging
+
+        stdin is closed so unattended runs can never block on a child waiting
+        for terminal input.
+        """
         logger.debug(f"Running command: {' '.join(cmd)}")
         try:
             if capture_output:
-                result = subprocess.run(cmd, check=check, capture_output=True, text=True, cwd=cwd)
+                result = subprocess.run(cmd, check=check, capture_output=True, text=True, cwd=cwd,
+                                        stdin=subprocess.DEVNULL)
             else:
-                result = subprocess.run(cmd, check=check, cwd=cwd)
+                result = subprocess.run(cmd, check=check, cwd=cwd, stdin=subprocess.DEVNULL)
             return result
         except subprocess.CalledProcessError as e:
             logger.error(f"Command failed: {' '.join(cmd)}")
@@ -114,10 +138,12 @@ class MISPUpdateManager:
 
     def get_current_version(self, service: str) -> Optional[str]:
         """Get current version of a MISP service using ps to check running containers"""
+        import json
+
         try:
             # Get running container info using JSON format
             result = self.run_command(
-                ['sudo', 'docker', 'compose', 'ps', '--format', 'json', service],
+                COMPOSE_PREFIX + ('ps', '--format', 'json', service),
                 cwd=self.misp_dir,
                 capture_output=True
             )
@@ -150,12 +176,82 @@ class MISPUpdateManager:
         # This function is informational only
         return "latest"
 
+    def _cache_etag(self) -> str:
+        """Fingerprint of the deployment: the image IDs of its containers
+
+        Pulling and recreating containers changes these (the compose file
+        itself is untouched by an update). Empty if they can't be listed.
+        """
+        try:
+            result = self.run_command(COMPOSE_PREFIX + ('images', '-q'), check=False,
+                                      capture_output=True, cwd=self.misp_dir)
+        except OSError:
+            return ""
+        if result.returncode != 0:
+            return ""
+        return ','.join(sorted(result.stdout.split()))
+
+    def _load_cached_versions(self) -> Optional[Dict[str, VersionInfo]]:
+        """Return cached version info if it is fresh and matches the deployment"""
+        import json
+        import time
+
+        try:
+            with open(UPDATE_CACHE_FILE) as f:
+                cache = json.load(f)
+            if time.time() - cache['ts'] >= UPDATE_CACHE_TTL:
+                return None
+            etag = self._cache_etag()
+            if not etag or cache['etag'] != etag:
+                return None
+            return {service: VersionInfo(**info) for service, info in cache['components'].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save_cached_versions(self, versions: Dict[str, VersionInfo]):
+        """Persist version info for later --check-only runs (best effort)"""
+        import json
+        import time
+        from dataclasses import asdict
+
+        etag = self._cache_etag()
+        if not etag:
+            return
+        cache = {
+            'ts': time.time(),
+            'etag': etag,
+            'components': {service: asdict(info) for service, info in versions.items()},
+        }
+        try:
+            with open(UPDATE_CACHE_FILE, 'w') as f:
+                json.dump(cache, f)
+        except OSError as e:
+            logger.debug(f"Could not write update cache: {e}")
+
+    def _clear_cached_versions(self):
+        """Drop cached version info before the images change"""
+        try:
+            UPDATE_CACHE_FILE.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f"Could not remove update cache: {e}")
+
     def check_updates(self) -> Dict[str, VersionInfo]:
         """Check for available updates"""
         logger.info("\n" + "=" * 50)
         logger.info("CHECKING FOR UPDATES")
         logger.info("=" * 50 + "\n")
 
+        # Updates always re-check; --check-only can reuse (and saves) a recent result
+        if self.check_only:
+            cached = self._load_cached_versions()
+            if cached is not None:
+                logger.info(f"Using cached version check (less than {UPDATE_CACHE_TTL // 60} minutes old)")
+                for service, info in cached.items():
+                    logger.info(f"{service}: current version {info.current}")
+                return cached
+
         services = {
             'misp-core': 'ghcr.io/misp/misp-docker/misp-core:latest',
             'misp-modules': 'ghcr.io/misp/misp-docker/misp-modules:latest'
@@ -182,6 +278,8 @@ class MISPUpdateManager:
                     update_available=False
                 )
 
+        if self.check_only:
+            self._save_cached_versions(versions)
         return versions
 
     def create_backup(self) -> bool:
@@ -225,7 +323,7 @@ class MISPUpdateManager:
         try:
             os.chdir(self.misp_dir)
             logger.info("Stopping containers...")
-            self.run_command(['sudo', 'docker', 'compose', 'stop'])
+            self.run_command(COMPOSE_PREFIX + ('stop',))
             logger.info(Colors.success("Services stopped"))
             return True
         except Exception as e:
@@ -241,7 +339,7 @@ class MISPUpdateManager:
         try:
             os.chdir(self.misp_dir)
             logger.info("Pulling latest images...")
-            self.run_command(['sudo', 'docker', 'compose', 'pull'])
+            self.run_command(COMPOSE_PREFIX + ('pull',))
             logger.info(Colors.success("Images pulled successfully"))
             return True
         except Exception as e:
@@ -257,7 +355,7 @@ class MISPUpdateManager:
         try:
             os.chdir(self.misp_dir)
             logger.info("Starting containers with new images...")
-            self.run_command(['sudo', 'docker', 'compose', 'up', '-d'])
+            self.run_command(COMPOSE_PREFIX + ('up', '-d'))
             logger.info(Colors.success("Services started"))
             return True
         except Exception as e:
@@ -270,13 +368,18 @@ class MISPUpdateManager:
         logger.info("WAITING FOR SERVICES TO BE HEALTHY")
         logger.info("=" * 50 + "\n")
 
+        # Only needed on the update path; kept out of --check-only startup
+        import contextlib
+        import json
+        import time
+
         start_time = time.time()
 
         while time.time() - start_time < timeout:
             try:
                 os.chdir(self.misp_dir)
                 result = self.run_command(
-                    ['sudo', 'docker', 'compose', 'ps', '--format', 'json'],
+                    COMPOSE_PREFIX + ('ps', '--format', 'json'),
                     capture_output=True
                 )
 
@@ -315,7 +418,7 @@ class MISPUpdateManager:
 
             # Check container status
             result = self.run_command(
-                ['sudo', 'docker', 'compose', 'ps'],
+                COMPOSE_PREFIX + ('ps',),
                 capture_output=True
             )
             logger.info("Container status:")
@@ -323,7 +426,7 @@ class MISPUpdateManager:
 
             # Check logs for errors
             result = self.run_command(
-                ['sudo', 'docker', 'compose', 'logs', '--tail=50', 'misp-core'],
+                COMPOSE_PREFIX + ('logs', '--tail=50', 'misp-core'),
                 capture_output=True
             )
 
@@ -356,7 +459,7 @@ class MISPUpdateManager:
             restore_script = Path(__file__).parent / 'misp-restore.py'
 
             if restore_script.exists():
-                self.run_command(['python3', str(restore_script), '--restore', str(self.backup_path)])
+                self.run_command(['python3', str(restore_script), '--restore', self.backup_path.name, '--yes'])
                 logger.info(Colors.success("Rollback completed"))
                 return True
             else:
@@ -369,12 +472,10 @@ class MISPUpdateManager:
 
     def update(self) -> bool:
         """Perform update"""
-        logger.info(Colors.info("\n" + "╔" + "=" * 48 + "╗"))
-        logger.info(Colors.info("║" + " " * 48 + "║"))
-        logger.info(Colors.info("║" + "     MISP Update Tool v2.0".center(48) + "║"))
-        logger.info(Colors.info("║" + "     tKQB Enterprises Edition".center(48) + "║"))
-        logger.info(Colors.info("║" + " " * 48 + "║"))
-        logger.info(Colors.info("╚" + "=" * 48 + "╝\n"))
+        if _is_tty:
+            logger.info(BANNER_STR)
+        else:
+            logger.info("MISP Update Tool v2.0 starting")
 
         # Check for updates
         self.check_updates()
@@ -385,6 +486,9 @@ class MISPUpdateManager:
             logger.info("=" * 50)
             return True
 
+        # The images are about to change, so a cached check would be stale
+        self._clear_cached_versions()
+
         # Confirm update
         logger.info("\n" + "=" * 50)
         logger.info(Colors.warning("READY TO UPDATE"))
@@ -494,6 +598,9 @@ Examples:
 
     args = parser.parse_args()
 
+    global logger
+    logger = setup_logging()
+
     # Verify MISP installation exists
     if not MISP_DIR.exists():
         logger.error(f"MISP installation not found at {MISP_DIR}")
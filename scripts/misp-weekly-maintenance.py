@@ -28,11 +28,14 @@ Created: October 2025
 """
 
 import argparse
+import re
 import subprocess
 import sys
+from dataclasses import dataclass
 from datetime import datetime
+from enum import IntFlag
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -40,37 +43,76 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from misp_logger import get_logger
 
 
+@dataclass(frozen=True)
 class WeeklyMaintenanceConfig:
     """Configuration for weekly MISP maintenance"""
 
-    MISP_DIR = Path("/opt/misp")
-    MISP_LOGS_DIR = MISP_DIR / "logs"
+    MISP_DIR: Path = Path("/opt/misp")
+    MISP_LOGS_DIR: Path = MISP_DIR / "logs"
 
     # Update timeouts (in seconds)
-    TAXONOMY_UPDATE_TIMEOUT = 180  # 3 minutes
-    GALAXY_UPDATE_TIMEOUT = 600    # 10 minutes (galaxies are large)
-    OBJECT_TEMPLATE_TIMEOUT = 120  # 2 minutes
-    NOTICE_LIST_TIMEOUT = 120      # 2 minutes
+    TAXONOMY_UPDATE_TIMEOUT: int = 180  # 3 minutes
+    GALAXY_UPDATE_TIMEOUT: int = 600    # 10 minutes (galaxies are large)
+    OBJECT_TEMPLATE_TIMEOUT: int = 120  # 2 minutes
+    NOTICE_LIST_TIMEOUT: int = 120      # 2 minutes
 
     # Taxonomies to verify are enabled (utilities sector)
-    REQUIRED_TAXONOMIES = [
+    REQUIRED_TAXONOMIES: Tuple[str, ...] = (
         'ics',                    # ICS/SCADA threats
         'dhs-ciip-sectors',       # Critical infrastructure sectors
         'tlp',                    # Traffic Light Protocol
         'workflow',               # Event workflow status
         'priority-level',         # Priority classification
         'incident-category',      # Incident types
-    ]
+    )
 
     # Galaxies to verify are updated (utilities sector)
-    REQUIRED_GALAXIES = [
+    REQUIRED_GALAXIES: Tuple[str, ...] = (
         'mitre-attack-pattern',   # MITRE ATT&CK tactics/techniques
         'mitre-ics-groups',       # ICS threat actors
         'mitre-ics-malware',      # ICS malware families
         'mitre-ics-software',     # ICS software tools
         'threat-actor',           # General threat actors
         'ransomware',             # Ransomware families
-    ]
+    )
+
+    # MySQL option file written inside the db container so credentials stay
+    # off the mysql command line (and out of its "insecure password" warning)
+    DB_DEFAULTS_FILE: str = '/tmp/.my.cnf'
+
+    # Cake console inside the misp-core container
+    CAKE = '/var/www/MISP/app/Console/cake'
+
+    # Admin update steps for tasks 1-4 (step key -> cake arguments)
+    CAKE_UPDATE_STEPS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+        ('taxonomies', ('Admin', 'updateTaxonomies')),
+        ('galaxies', ('Admin', 'updateGalaxies', '--force')),
+        ('object_templates', ('Admin', 'updateObjectTemplates')),
+        ('notice_lists', ('Admin', 'updateNoticeLists')),
+    )
+
+
+class Warn(IntFlag):
+    """Known weekly maintenance failure modes, collected as a bitmask"""
+    TAX = 1
+    GAL = 2
+    OBJ = 4
+    NOTICE = 8
+    DB_OPT = 16
+
+
+# Report text for each warning flag
+WARNING_MESSAGES = {
+    Warn.TAX: "Taxonomy update failed",
+    Warn.GAL: "Galaxy update failed",
+    Warn.OBJ: "Object template update failed",
+    Warn.NOTICE: "Notice list update failed",
+    Warn.DB_OPT: "{db_tables_failed} database tables failed to optimize",
+}
+
+
+# Sentinel echoed after each step of the batched cake update
+STEP_SENTINEL_RE = re.compile(r'^===STEP:(\w+):(OK|FAIL)===$')
 
 
 class MISPWeeklyMaintenance:
@@ -85,6 +127,10 @@ class MISPWeeklyMaintenance:
     MAGENTA = '\033[0;35m'
     NC = '\033[0m'  # No Color
 
+    # Container exec prefixes, built once and shared by every call
+    EXEC_PREFIX = ('sudo', 'docker', 'compose', 'exec', '-T', 'misp-core')
+    DB_EXEC_PREFIX = ('sudo', 'docker', 'compose', 'exec', '-T', 'db')
+
     def __init__(self, dry_run: bool = False):
         self.config = WeeklyMaintenanceConfig()
         self.dry_run = dry_run
@@ -92,36 +138,58 @@ class MISPWeeklyMaintenance:
 
         self.tasks_completed = 0
         self.tasks_failed = 0
-        self.warnings = []
+        self.warnings = Warn(0)
+        self.db_tables_failed = 0
+
+        # Per-step (success, output) from run_cake_update_batch()
+        self.cake_update_results: Dict[str, Tuple[bool, str]] = {}
+
+        # Console lines buffered until the current task finishes
+        self.output_lines: List[str] = []
+
+    def emit(self, line: str = ""):
+        """Queue a console line; written out by flush_output()"""
+        self.output_lines.append(line)
+
+    def flush_output(self):
+        """Write all queued console lines with a single stdout write"""
+        if self.output_lines:
+            sys.stdout.write("\n".join(self.output_lines) + "\n")
+            sys.stdout.flush()
+            self.output_lines = []
 
     def banner(self):
         """Display script banner"""
-        print(f"{self.MAGENTA}{'='*80}{self.NC}")
-        print(f"{self.MAGENTA}  MISP Weekly Maintenance{self.NC}")
-        print(f"{self.MAGENTA}  {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{self.NC}")
+        self.emit(f"{self.MAGENTA}{'='*80}{self.NC}")
+        self.emit(f"{self.MAGENTA}  MISP Weekly Maintenance{self.NC}")
+        self.emit(f"{self.MAGENTA}  {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{self.NC}")
         if self.dry_run:
-            print(f"{self.YELLOW}  [DRY-RUN MODE - No changes will be made]{self.NC}")
-        print(f"{self.MAGENTA}{'='*80}{self.NC}")
-        print()
+            self.emit(f"{self.YELLOW}  [DRY-RUN MODE - No changes will be made]{self.NC}")
+        self.emit(f"{self.MAGENTA}{'='*80}{self.NC}")
+        self.emit()
 
     def section_header(self, title: str):
         """Print section header"""
-        print(f"\n{self.BLUE}{'='*80}{self.NC}")
-        print(f"{self.BLUE}  {title}{self.NC}")
-        print(f"{self.BLUE}{'='*80}{self.NC}\n")
+        self.emit(f"\n{self.BLUE}{'='*80}{self.NC}")
+        self.emit(f"{self.BLUE}  {title}{self.NC}")
+        self.emit(f"{self.BLUE}{'='*80}{self.NC}\n")
 
     def run_docker_command(self, command: List[str], description: str = "", timeout: int = 60) -> Tuple[bool, str]:
         """Run docker compose exec command with error handling"""
-        full_command = ['sudo', 'docker', 'compose', 'exec', '-T', 'misp-core'] + command
+        full_command = self.EXEC_PREFIX + tuple(command)
 
         if self.dry_run:
-            print(f"{self.YELLOW}[DRY-RUN] Would run:{self.NC} {description}")
+            self.emit(f"{self.YELLOW}[DRY-RUN] Would run:{self.NC} {description}")
             return True, ""
 
+        # Show what has been queued so far before a potentially long exec
+        self.flush_output()
+
         try:
             result = subprocess.run(
                 full_command,
                 cwd=str(self.config.MISP_DIR),
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
                 timeout=timeout
@@ -145,27 +213,75 @@ class MISPWeeklyMaintenance:
                              error=str(e))
             return False, str(e)
 
+    def run_cake_update_batch(self):
+        """Run the Admin update steps for tasks 1-4 in a single container exec
+
+        Each step echoes a sentinel line with its result so tasks 1-4 can still
+        report individually. A failing step does not stop the steps after it.
+        """
+        if self.dry_run:
+            return
+
+        cake = self.config.CAKE
+        script = ' ; '.join(
+            f"{cake} {' '.join(args)} && echo '===STEP:{step}:OK===' || echo '===STEP:{step}:FAIL==='"
+            for step, args in self.config.CAKE_UPDATE_STEPS
+        )
+        timeout = (self.config.TAXONOMY_UPDATE_TIMEOUT + self.config.GALAXY_UPDATE_TIMEOUT +
+                   self.config.OBJECT_TEMPLATE_TIMEOUT + self.config.NOTICE_LIST_TIMEOUT)
+
+        self.emit("Running taxonomy, galaxy, object template and notice list updates...")
+        self.emit("Galaxies are the largest update; this may take 5-10 minutes.")
+        self.emit()
+
+        success, output = self.run_docker_command(
+            ['sh', '-c', script],
+            "Update taxonomies, galaxies, object templates and notice lists",
+            timeout=timeout
+        )
+
+        step_lines: List[str] = []
+        for line in output.splitlines():
+            match = STEP_SENTINEL_RE.match(line.strip())
+            if match:
+                self.cake_update_results[match.group(1)] = (match.group(2) == 'OK', '\n'.join(step_lines))
+                step_lines = []
+            else:
+                step_lines.append(line)
+
+        # Steps without a sentinel never finished (timeout or exec failure)
+        for step, _args in self.config.CAKE_UPDATE_STEPS:
+            self.cake_update_results.setdefault(step, (False, output if not success else ""))
+
+    def run_cake_update(self, step: str, description: str, timeout: int) -> Tuple[bool, str]:
+        """Return the batched result for an Admin update step, or run it on its own"""
+        if step in self.cake_update_results:
+            return self.cake_update_results[step]
+
+        args = dict(self.config.CAKE_UPDATE_STEPS)[step]
+        return self.run_docker_command([self.config.CAKE, *args], description, timeout=timeout)
+
     def task_1_update_taxonomies(self) -> bool:
         """Task 1: Update MISP taxonomies"""
         self.section_header("Task 1: Update Taxonomies")
 
-        print("Updating taxonomies (classification systems)...")
-        print("Taxonomies include: TLP, ICS, Critical Infrastructure, Priority Levels")
-        print()
+        self.emit("Updating taxonomies (classification systems)...")
+        self.emit("Taxonomies include: TLP, ICS, Critical Infrastructure, Priority Levels")
+        self.emit()
 
-        success, output = self.run_docker_command(
-            ['/var/www/MISP/app/Console/cake', 'Admin', 'updateTaxonomies'],
+        success, output = self.run_cake_update(
+            'taxonomies',
             "Update taxonomies",
             timeout=self.config.TAXONOMY_UPDATE_TIMEOUT
         )
 
         if success:
-            print(f"{self.GREEN}✓ Taxonomies updated successfully{self.NC}")
+            self.emit(f"{self.GREEN}✓ Taxonomies updated successfully{self.NC}")
             self.tasks_completed += 1
             return True
         else:
-            print(f"{self.RED}✗ Failed to update taxonomies{self.NC}")
-            self.warnings.append("Taxonomy update failed")
+            self.emit(f"{self.RED}✗ Failed to update taxonomies{self.NC}")
+            self.warnings |= Warn.TAX
             self.tasks_failed += 1
             return False
 
@@ -173,23 +289,23 @@ class MISPWeeklyMaintenance:
         """Task 2: Update MISP galaxies (MITRE ATT&CK, threat actors, malware)"""
         self.section_header("Task 2: Update Galaxies")
 
-        print("Updating galaxies (MITRE ATT&CK, threat actors, malware families)...")
-        print("This is the largest update and may take 5-10 minutes.")
-        print()
+        self.emit("Updating galaxies (MITRE ATT&CK, threat actors, malware families)...")
+        self.emit("This is the largest update and may take 5-10 minutes.")
+        self.emit()
 
-        success, output = self.run_docker_command(
-            ['/var/www/MISP/app/Console/cake', 'Admin', 'updateGalaxies', '--force'],
+        success, output = self.run_cake_update(
+            'galaxies',
             "Update galaxies",
             timeout=self.config.GALAXY_UPDATE_TIMEOUT
         )
 
         if success:
-            print(f"{self.GREEN}✓ Galaxies updated successfully{self.NC}")
+            self.emit(f"{self.GREEN}✓ Galaxies updated successfully{self.NC}")
             self.tasks_completed += 1
             return True
         else:
-            print(f"{self.RED}✗ Failed to update galaxies{self.NC}")
-            self.warnings.append("Galaxy update failed")
+            self.emit(f"{self.RED}✗ Failed to update galaxies{self.NC}")
+            self.warnings |= Warn.GAL
             self.tasks_failed += 1
             return False
 
@@ -197,23 +313,23 @@ class MISPWeeklyMaintenance:
         """Task 3: Update MISP object templates"""
         self.section_header("Task 3: Update Object Templates")
 
-        print("Updating object templates...")
-        print("Templates for structured threat intelligence objects.")
-        print()
+        self.emit("Updating object templates...")
+        self.emit("Templates for structured threat intelligence objects.")
+        self.emit()
 
-        success, output = self.run_docker_command(
-            ['/var/www/MISP/app/Console/cake', 'Admin', 'updateObjectTemplates'],
+        success, output = self.run_cake_update(
+            'object_templates',
             "Update object templates",
             timeout=self.config.OBJECT_TEMPLATE_TIMEOUT
         )
 
         if success:
-            print(f"{self.GREEN}✓ Object templates updated successfully{self.NC}")
+            self.emit(f"{self.GREEN}✓ Object templates updated successfully{self.NC}")
             self.tasks_completed += 1
             return True
         else:
-            print(f"{self.RED}✗ Failed to update object templates{self.NC}")
-            self.warnings.append("Object template update failed")
+            self.emit(f"{self.RED}✗ Failed to update object templates{self.NC}")
+            self.warnings |= Warn.OBJ
             self.tasks_failed += 1
             return False
 
@@ -221,22 +337,22 @@ class MISPWeeklyMaintenance:
         """Task 4: Update MISP notice lists"""
         self.section_header("Task 4: Update Notice Lists")
 
-        print("Updating notice lists...")
-        print()
+        self.emit("Updating notice lists...")
+        self.emit()
 
-        success, output = self.run_docker_command(
-            ['/var/www/MISP/app/Console/cake', 'Admin', 'updateNoticeLists'],
+        success, output = self.run_cake_update(
+            'notice_lists',
             "Update notice lists",
             timeout=self.config.NOTICE_LIST_TIMEOUT
         )
 
         if success:
-            print(f"{self.GREEN}✓ Notice lists updated successfully{self.NC}")
+            self.emit(f"{self.GREEN}✓ Notice lists updated successfully{self.NC}")
             self.tasks_completed += 1
             return True
         else:
-            print(f"{self.RED}✗ Failed to update notice lists{self.NC}")
-            self.warnings.append("Notice list update failed")
+            self.emit(f"{self.RED}✗ Failed to update notice lists{self.NC}")
+            self.warnings |= Warn.NOTICE
             self.tasks_failed += 1
             return False
 
@@ -244,29 +360,60 @@ class MISPWeeklyMaintenance:
         """Task 5: Verify utilities sector configurations are enabled"""
         self.section_header("Task 5: Verify Utilities Sector Configuration")
 
-        print("Verifying utilities sector taxonomies and galaxies are enabled...")
-        print()
+        self.emit("Verifying utilities sector taxonomies and galaxies are enabled...")
+        self.emit()
 
         # This would require API or database queries to verify
         # For now, we'll just log that this check should be done
-        print(f"{self.YELLOW}Note: Manual verification recommended:{self.NC}")
-        print("  1. Check ICS taxonomy is enabled")
-        print("  2. Check DHS-CIIP sectors taxonomy is enabled")
-        print("  3. Verify MITRE ATT&CK for ICS is updated")
-        print("  4. Verify ICS threat actors are in galaxy")
-        print()
-        print(f"{self.GREEN}✓ Configuration verification noted{self.NC}")
+        self.emit(f"{self.YELLOW}Note: Manual verification recommended:{self.NC}")
+        self.emit("  1. Check ICS taxonomy is enabled")
+        self.emit("  2. Check DHS-CIIP sectors taxonomy is enabled")
+        self.emit("  3. Verify MITRE ATT&CK for ICS is updated")
+        self.emit("  4. Verify ICS threat actors are in galaxy")
+        self.emit()
+        self.emit(f"{self.GREEN}✓ Configuration verification noted{self.NC}")
 
         self.tasks_completed += 1
         return True
 
+    def _write_db_defaults_file(self) -> bool:
+        """Write the MySQL client option file inside the db container"""
+        # Credentials go over stdin so they never appear on any command line
+        try:
+            result = subprocess.run(
+                self.DB_EXEC_PREFIX + ('sh', '-c', f'umask 077 && cat > {self.config.DB_DEFAULTS_FILE}'),
+                cwd=str(self.config.MISP_DIR),
+                input='[client]\nuser=misp\npassword=misp\n',
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+            return result.returncode == 0
+        except Exception as e:
+            self.logger.warning("Could not write MySQL option file", error=str(e))
+            return False
+
+    def _remove_db_defaults_file(self):
+        """Remove the MySQL client option file from the db container"""
+        try:
+            subprocess.run(
+                self.DB_EXEC_PREFIX + ('rm', '-f', self.config.DB_DEFAULTS_FILE),
+                cwd=str(self.config.MISP_DIR),
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+        except Exception as e:
+            self.logger.warning("Could not remove MySQL option file", error=str(e))
+
     def task_6_optimize_database(self) -> bool:
         """Task 6: Optimize MISP database"""
         self.section_header("Task 6: Optimize Database")
 
-        print("Optimizing MISP database tables...")
-        print("This improves query performance and reduces fragmentation.")
-        print()
+        self.emit("Optimizing MISP database tables...")
+        self.emit("This improves query performance and reduces fragmentation.")
+        self.emit()
 
         # Run MySQL OPTIMIZE on key tables
         tables_to_optimize = [
@@ -281,36 +428,50 @@ class MISPWeeklyMaintenance:
         optimized = 0
         failed = 0
 
-        for table in tables_to_optimize:
-            if self.dry_run:
-                print(f"{self.YELLOW}[DRY-RUN] Would optimize table:{self.NC} {table}")
+        # Show the header before the (potentially minutes-long) OPTIMIZE loop
+        self.flush_output()
+
+        if self.dry_run:
+            for table in tables_to_optimize:
+                self.emit(f"{self.YELLOW}[DRY-RUN] Would optimize table:{self.NC} {table}")
                 optimized += 1
-            else:
-                try:
-                    result = subprocess.run(
-                        ['sudo', 'docker', 'compose', 'exec', '-T', 'db',
-                         'mysql', '-umisp', '-pmisp', 'misp', '-e', f'OPTIMIZE TABLE {table};'],
-                        cwd=str(self.config.MISP_DIR),
-                        capture_output=True,
-                        text=True,
-                        timeout=120
-                    )
-
-                    if result.returncode == 0:
-                        print(f"{self.GREEN}✓ Optimized table: {table}{self.NC}")
-                        optimized += 1
-                    else:
-                        print(f"{self.YELLOW}⚠ Could not optimize table: {table}{self.NC}")
+        elif not self._write_db_defaults_file():
+            self.emit(f"{self.YELLOW}⚠ Could not write MySQL option file, skipping optimization{self.NC}")
+            failed = len(tables_to_optimize)
+        else:
+            mysql_auth = f'--defaults-file={self.config.DB_DEFAULTS_FILE}'
+            try:
+                for table in tables_to_optimize:
+                    try:
+                        result = subprocess.run(
+                            self.DB_EXEC_PREFIX + ('mysql', mysql_auth, '-N', '-s', 'misp',
+                                                   '-e', f'OPTIMIZE TABLE {table};'),
+                            cwd=str(self.config.MISP_DIR),
+                            stdin=subprocess.DEVNULL,
+                            capture_output=True,
+                            text=True,
+                            timeout=120
+                        )
+
+                        if result.returncode == 0:
+                            self.emit(f"{self.GREEN}✓ Optimized table: {table}{self.NC}")
+                            optimized += 1
+                        else:
+                            self.emit(f"{self.YELLOW}⚠ Could not optimize table: {table}{self.NC}")
+                            failed += 1
+                    except Exception as e:
+                        self.emit(f"{self.YELLOW}⚠ Error optimizing table {table}: {e}{self.NC}")
                         failed += 1
-                except Exception as e:
-                    print(f"{self.YELLOW}⚠ Error optimizing table {table}: {e}{self.NC}")
-                    failed += 1
+                    self.flush_output()
+            finally:
+                self._remove_db_defaults_file()
 
-        print()
-        print(f"Database optimization: {optimized} tables optimized, {failed} failed")
+        self.emit()
+        self.emit(f"Database optimization: {optimized} tables optimized, {failed} failed")
 
         if failed > 0:
-            self.warnings.append(f"{failed} database tables failed to optimize")
+            self.warnings |= Warn.DB_OPT
+            self.db_tables_failed = failed
 
         self.tasks_completed += 1
         return True
@@ -319,8 +480,8 @@ class MISPWeeklyMaintenance:
         """Task 7: Generate MISP statistics"""
         self.section_header("Task 7: Generate Statistics")
 
-        print("Generating MISP usage statistics...")
-        print()
+        self.emit("Generating MISP usage statistics...")
+        self.emit()
 
         # Get event count
         success_events, output_events = self.run_docker_command(
@@ -337,13 +498,13 @@ class MISPWeeklyMaintenance:
         )
 
         if success_events or success_attrs:
-            print(f"{self.GREEN}✓ Statistics generated{self.NC}")
+            self.emit(f"{self.GREEN}✓ Statistics generated{self.NC}")
             if output_events:
-                print(f"  Events: {output_events.strip()}")
+                self.emit(f"  Events: {output_events.strip()}")
             if output_attrs:
-                print(f"  Attributes: {output_attrs.strip()}")
+                self.emit(f"  Attributes: {output_attrs.strip()}")
         else:
-            print(f"{self.YELLOW}⚠ Could not retrieve all statistics{self.NC}")
+            self.emit(f"{self.YELLOW}⚠ Could not retrieve all statistics{self.NC}")
 
         self.tasks_completed += 1
         return True
@@ -355,70 +516,66 @@ class MISPWeeklyMaintenance:
         total_tasks = self.tasks_completed + self.tasks_failed
         success_rate = (self.tasks_completed / total_tasks * 100) if total_tasks > 0 else 0
 
-        print(f"  Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"  Tasks Completed: {self.tasks_completed}")
-        print(f"  Tasks Failed: {self.tasks_failed}")
-        print(f"  Success Rate: {success_rate:.1f}%")
-        print()
+        self.emit(f"  Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        self.emit(f"  Tasks Completed: {self.tasks_completed}")
+        self.emit(f"  Tasks Failed: {self.tasks_failed}")
+        self.emit(f"  Success Rate: {success_rate:.1f}%")
+        self.emit()
 
         if self.warnings:
-            print(f"{self.YELLOW}Warnings ({len(self.warnings)}):{self.NC}")
-            for warning in self.warnings:
-                print(f"  • {warning}")
-            print()
-
-        print(f"{self.CYAN}Next Steps:{self.NC}")
-        print("  1. Review MISP web interface for new taxonomies/galaxies")
-        print("  2. Enable any new relevant ICS/utilities threat actors")
-        print("  3. Check OSINT feeds are fetching data (via daily maintenance)")
-        print("  4. Review MISP logs for any errors")
-        print()
+            active = [flag for flag in Warn if flag in self.warnings]
+            self.emit(f"{self.YELLOW}Warnings ({len(active)}):{self.NC}")
+            for flag in active:
+                self.emit(f"  • {WARNING_MESSAGES[flag].format(db_tables_failed=self.db_tables_failed)}")
+            self.emit()
+
+        self.emit(f"{self.CYAN}Next Steps:{self.NC}")
+        self.emit("  1. Review MISP web interface for new taxonomies/galaxies")
+        self.emit("  2. Enable any new relevant ICS/utilities threat actors")
+        self.emit("  3. Check OSINT feeds are fetching data (via daily maintenance)")
+        self.emit("  4. Review MISP logs for any errors")
+        self.emit()
 
         if self.tasks_failed == 0 and not self.warnings:
-            print(f"{self.GREEN}✓ All weekly maintenance tasks completed successfully!{self.NC}")
+            self.emit(f"{self.GREEN}✓ All weekly maintenance tasks completed successfully!{self.NC}")
         elif self.tasks_failed > 0:
-            print(f"{self.RED}✗ Some tasks failed - review logs for details{self.NC}")
+            self.emit(f"{self.RED}✗ Some tasks failed - review logs for details{self.NC}")
         else:
-            print(f"{self.YELLOW}⚠ Tasks completed with warnings - review above{self.NC}")
+            self.emit(f"{self.YELLOW}⚠ Tasks completed with warnings - review above{self.NC}")
 
-        print()
+        self.emit()
 
-        # Log summary
+        # Log summary (its console line goes out after the report)
+        self.flush_output()
         self.logger.info("Weekly maintenance completed",
                         event_type="maintenance",
                         action="weekly_maintenance",
                         result="success" if self.tasks_failed == 0 else "partial",
                         tasks_completed=self.tasks_completed,
                         tasks_failed=self.tasks_failed,
-                        warnings=len(self.warnings))
+                        warnings=int(self.warnings))
 
     def run_all_tasks(self):
         """Run all weekly maintenance tasks"""
-        self.banner()
-
-        # Task 1: Update taxonomies
-        self.task_1_update_taxonomies()
-
-        # Task 2: Update galaxies (longest task)
-        self.task_2_update_galaxies()
-
-        # Task 3: Update object templates
-        self.task_3_update_object_templates()
-
-        # Task 4: Update notice lists
-        self.task_4_update_notice_lists()
-
-        # Task 5: Verify utilities sector config
-        self.task_5_verify_utilities_config()
-
-        # Task 6: Optimize database
-        self.task_6_optimize_database()
-
-        # Task 7: Generate statistics
-        self.task_7_generate_statistics()
+        steps = (
+            self.banner,
+            self.run_cake_update_batch,             # Tasks 1-4 share one container exec
+            self.task_1_update_taxonomies,
+            self.task_2_update_galaxies,            # Longest task
+            self.task_3_update_object_templates,
+            self.task_4_update_notice_lists,
+            self.task_5_verify_utilities_config,
+            self.task_6_optimize_database,
+            self.task_7_generate_statistics,
+            self.generate_weekly_report,
+        )
 
-        # Generate report
-        self.generate_weekly_report()
+        # Each step's console output goes out in one write, even if it raises
+        for step in steps:
+            try:
+                step()
+            finally:
+                self.flush_output()
 
         # Return exit code
         return 0 if self.tasks_failed == 0 else 1
@@ -15,15 +15,36 @@ Features:
 - Console output with color coding
 """
 
+import atexit
+import copy
+import fcntl
 import getpass
 import json
 import logging
 import logging.handlers
 import os
+import queue
 import socket
 import sys
+import time
 from datetime import datetime, timezone
-from pathlib import Path
+from pathlib import Path, PosixPath, PurePosixPath
+from typing import Union
+from uuid import UUID
+
+# Optional fast JSON encoder - stdlib json is used when it is not installed
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional structlog backend - see get_logger(backend='structlog')
+try:
+    import structlog
+    HAS_STRUCTLOG = True
+except ImportError:
+    HAS_STRUCTLOG = False
 
 # ==========================================
 # Configuration
@@ -94,6 +115,19 @@ class CIMFields:
     BACKUP_NAME = "backup_name"  # Backup filename
 
 
+# Field names read on every record, bound once so the formatters do a
+# module-global load instead of a class attribute lookup per use
+_TIMESTAMP = CIMFields.TIMESTAMP
+_SOURCE = CIMFields.SOURCE
+_SOURCETYPE = CIMFields.SOURCETYPE
+_SEVERITY = CIMFields.SEVERITY
+_MESSAGE = CIMFields.MESSAGE
+_EXCEPTION = CIMFields.EXCEPTION
+_STATUS = CIMFields.STATUS
+_EVENT_TYPE = CIMFields.EVENT_TYPE
+_COMPONENT = CIMFields.COMPONENT
+
+
 # ==========================================
 # Color Output for Console
 # ==========================================
@@ -117,6 +151,36 @@ class Colors:
     }
 
 
+# Serializers for non-JSON-native values seen in log fields, looked up by
+# exact type; anything else falls back to str()
+_JSON_DEFAULTS = {
+    PosixPath: str,
+    PurePosixPath: str,
+    UUID: str,
+    bytes: lambda value: value.decode('utf-8', 'replace'),
+}
+
+
+def _json_default(value):
+    """JSON default hook: typed dispatch instead of a blanket str()"""
+    serializer = _JSON_DEFAULTS.get(type(value))
+    if serializer is not None:
+        return serializer(value)
+    return str(value)
+
+
+def _iso_utc(created: float) -> str:
+    """Render an epoch timestamp as ISO 8601 UTC with microseconds and a Z suffix"""
+    seconds = int(created)
+    micros = int((created - seconds) * 1_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{micros:06d}Z"
+
+
+# Bound once for the console formatter's per-record lookups
+_SEVERITY_COLORS = Colors.SEVERITY_COLORS
+_NC = Colors.NC
+
+
 # ==========================================
 # JSON Formatter
 # ==========================================
@@ -128,32 +192,62 @@ class CIMJSONFormatter(logging.Formatter):
         super().__init__()
         self.hostname = socket.gethostname()
         self.username = getpass.getuser()
+        self.pid = os.getpid()
 
-    def format(self, record: logging.LogRecord) -> str:
-        """Format log record as JSON with CIM fields"""
+        # Same lookup logging.LogRecord uses, without importing multiprocessing
+        mp = sys.modules.get('multiprocessing')
+        self.process_name = mp.current_process().name if mp is not None else 'MainProcess'
 
-        # Base CIM fields
-        log_entry = {
-            CIMFields.TIMESTAMP: datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+        # Template for every entry: fixed fields filled in once, per-record
+        # fields as placeholders so the output keeps its usual key order
+        self._base = {
+            CIMFields.TIMESTAMP: None,
             CIMFields.HOST: self.hostname,
             CIMFields.USER: self.username,
-            CIMFields.SOURCE: record.name,
-            CIMFields.SOURCETYPE: getattr(record, 'sourcetype', 'misp:script'),
-            CIMFields.SEVERITY: record.levelname,
-            CIMFields.MESSAGE: record.getMessage(),
-            CIMFields.PROCESS: record.processName,
-            CIMFields.PROCESS_ID: record.process,
+            CIMFields.SOURCE: None,
+            CIMFields.SOURCETYPE: None,
+            CIMFields.SEVERITY: None,
+            CIMFields.MESSAGE: None,
+            CIMFields.PROCESS: self.process_name,
+            CIMFields.PROCESS_ID: self.pid,
         }
 
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record as JSON with CIM fields"""
+
+        # Base CIM fields
+        log_entry = self._base.copy()
+        # Event time comes from record.created (set when the record was made);
+        # orjson renders aware datetimes as ISO 8601 with a Z suffix itself
+        if HAS_ORJSON:
+            log_entry[_TIMESTAMP] = datetime.fromtimestamp(record.created, timezone.utc)
+        else:
+            log_entry[_TIMESTAMP] = _iso_utc(record.created)
+        log_entry[_SOURCE] = record.name
+        log_entry[_SOURCETYPE] = getattr(record, 'sourcetype', 'misp:script')
+        log_entry[_SEVERITY] = record.levelname
+        log_entry[_MESSAGE] = record.getMessage()
+
         # Add custom fields from extra parameter
-        if hasattr(record, 'extra_fields'):
-            log_entry.update(record.extra_fields)
+        extras = getattr(record, 'extra_fields', None)
+        if extras:
+            log_entry.update(extras)
 
         # Add exception info if present
+        # Format the traceback once per record, like logging.Formatter does
         if record.exc_info:
-            log_entry[CIMFields.EXCEPTION] = self.formatException(record.exc_info)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_entry[_EXCEPTION] = record.exc_text
+
+        if HAS_ORJSON:
+            try:
+                return orjson.dumps(log_entry, default=_json_default, option=orjson.OPT_UTC_Z).decode('utf-8')
+            except TypeError:
+                # e.g. integers wider than 64 bits - let stdlib json handle it
+                log_entry[_TIMESTAMP] = _iso_utc(record.created)
 
-        return json.dumps(log_entry, default=str)
+        return json.dumps(log_entry, default=_json_default)
 
 
 # ==========================================
@@ -163,24 +257,169 @@ class CIMJSONFormatter(logging.Formatter):
 class ColoredConsoleFormatter(logging.Formatter):
     """Colored console output formatter"""
 
+    def __init__(self):
+        super().__init__()
+        # Pipes and cron logs get plain text instead of ANSI escapes
+        self._use_color = sys.stdout is not None and sys.stdout.isatty()
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors for console"""
 
         severity = record.levelname
-        color = Colors.SEVERITY_COLORS.get(severity, Colors.NC)
 
         # Get message
         message = record.getMessage()
 
         # Add custom fields if present
-        if hasattr(record, 'extra_fields'):
-            extras = record.extra_fields
-            if CIMFields.EVENT_TYPE in extras:
-                message = f"[{extras[CIMFields.EVENT_TYPE]}] {message}"
-            if CIMFields.COMPONENT in extras:
-                message = f"{message} (component={extras[CIMFields.COMPONENT]})"
+        extras = getattr(record, 'extra_fields', None)
+        if extras:
+            event_type = extras.get(_EVENT_TYPE)
+            component = extras.get(_COMPONENT)
+            if event_type:
+                message = f"[{event_type}] {message}"
+            if component:
+                message = f"{message} (component={component})"
 
-        return f"{color}[{severity}] {message}{Colors.NC}"
+        if not self._use_color:
+            return f"[{severity}] {message}"
+        return f"{_SEVERITY_COLORS.get(severity, _NC)}[{severity}] {message}{_NC}"
+
+
+# ==========================================
+# Background File Writer
+# ==========================================
+
+class CIMQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener thread.
+
+    The stock prepare() renders the message with a plain formatter and drops
+    exc_info, which would lose the structured exception field in the JSON
+    output. Here only the %-args are merged (so later mutation of the args
+    cannot change what is logged) and the record is passed on as-is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class CIMQueueListener(logging.handlers.QueueListener):
+    """Queue listener that flushes its handlers whenever the queue runs dry"""
+
+    def handle(self, record: logging.LogRecord):
+        super().handle(record)
+        # Bursts stay batched; a quiet logger still gets its lines on disk
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+
+class BatchedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that writes and flushes records in batches.
+
+    Formatted records are buffered and written with one write()+flush() once
+    FLUSH_RECORDS are pending or FLUSH_INTERVAL seconds have passed since the
+    last flush. flush() and close() always drain the buffer.
+
+    Every run of a script appends to the same file, so runs may overlap (cron
+    plus a manual run, possibly as different users). Files are created
+    group-writable, rollover is serialized across processes with a lock file,
+    and a process whose file was rotated by another one reopens the new file
+    instead of rotating again.
+    """
+
+    FLUSH_RECORDS = 64
+    FLUSH_INTERVAL = 0.25  # seconds
+    FILE_MODE = 0o664
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._last_flush = time.monotonic()
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            line = self.format(record) + self.terminator
+            self._buffer.append(line)
+            self._buffer_bytes += len(line)
+            if (len(self._buffer) >= self.FLUSH_RECORDS or
+                    time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL):
+                self._write_buffer()
+        except Exception:
+            self.handleError(record)
+
+    def _open(self):
+        """Open the log file, making it group-writable if this process created it"""
+        stream = super()._open()
+        try:
+            # umask usually strips group write; only the owner may chmod
+            if os.fstat(stream.fileno()).st_uid == os.geteuid():
+                os.chmod(self.baseFilename, self.FILE_MODE)
+        except OSError:
+            pass
+        return stream
+
+    def _file_size(self) -> int:
+        """Size of the log file on disk, or -1 if the open stream no longer is that file"""
+        try:
+            on_disk = os.stat(self.baseFilename)
+        except OSError:
+            return -1
+        if os.fstat(self.stream.fileno()).st_ino != on_disk.st_ino:
+            return -1
+        return on_disk.st_size
+
+    def _reopen(self):
+        """Switch to the current log file after another process rotated it"""
+        if self.stream is not None:
+            self.stream.close()
+        self.stream = self._open()
+
+    def _write_buffer(self):
+        """Write pending records, rotating first if they would overflow the file"""
+        if self._buffer:
+            if self.stream is None:
+                self.stream = self._open()
+            size = self._file_size()
+            if size < 0:
+                self._reopen()
+                size = self._file_size()
+            if self.maxBytes > 0 and size > 0 and size + self._buffer_bytes >= self.maxBytes:
+                # Read-only is enough for flock, and works on another user's lock file
+                lock_fd = os.open(self.baseFilename + '.lock', os.O_RDONLY | os.O_CREAT,
+                                  self.FILE_MODE)
+                try:
+                    fcntl.flock(lock_fd, fcntl.LOCK_EX)
+                    # Another process may have rotated while this one waited
+                    if self._file_size() < 0:
+                        self._reopen()
+                    else:
+                        self.doRollover()
+                        if self.stream is None:
+                            self.stream = self._open()
+                finally:
+                    os.close(lock_fd)
+            self.stream.write(''.join(self._buffer))
+            self.stream.flush()
+            self._buffer = []
+            self._buffer_bytes = 0
+        self._last_flush = time.monotonic()
+
+    def flush(self):
+        self.acquire()
+        try:
+            self._write_buffer()
+        finally:
+            self.release()
+
+    def close(self):
+        self.flush()
+        super().close()
 
 
 # ==========================================
@@ -198,6 +437,32 @@ class MISPLogger:
         logger.error("Backup failed", error_message="Permission denied")
     """
 
+    __slots__ = ('script_name', 'sourcetype', 'logger')
+
+    # Keyword argument -> CIM field name used by _log()
+    _KW_TO_CIM = {
+        'event_id': CIMFields.EVENT_ID,
+        'event_type': CIMFields.EVENT_TYPE,
+        'action': CIMFields.ACTION,
+        'component': CIMFields.COMPONENT,
+        'phase': CIMFields.PHASE,
+        'duration': CIMFields.DURATION,
+        'bytes': CIMFields.BYTES,
+        'count': CIMFields.COUNT,
+        'error_code': CIMFields.ERROR_CODE,
+        'error_message': CIMFields.ERROR_MESSAGE,
+        'file_path': CIMFields.FILE_PATH,
+        'file_size': CIMFields.FILE_SIZE,
+        'container': CIMFields.CONTAINER,
+        'image': CIMFields.IMAGE,
+        'backup_type': CIMFields.BACKUP_TYPE,
+        'backup_name': CIMFields.BACKUP_NAME,
+    }
+
+    # File handlers shared by every MISPLogger writing to the same file,
+    # keyed by (log file, max bytes, backup count)
+    _HANDLER_CACHE = {}
+
     def __init__(self, script_name: str, sourcetype: str = 'misp:script',
                  log_to_file: bool = True, log_to_console: bool = True):
         """
@@ -228,10 +493,14 @@ class MISPLogger:
         if log_to_console:
             self._setup_console_handler()
 
-    def _setup_file_handler(self):
-        """Setup rotating file handler with JSON formatting - with graceful fallback"""
+    @staticmethod
+    def _ensure_log_dir(log_dir: Path) -> bool:
+        """Create the log directory if needed; False means file logging is unavailable"""
 
-        log_dir = LogConfig.LOG_DIR
+        # Steady state: the directory already exists (created in Phase 1), so
+        # skip the mkdir/sudo/chmod setup entirely
+        if log_dir.is_dir():
+            return True
 
         # Try to create log directory
         try:
@@ -244,8 +513,7 @@ class MISPLogger:
                 subprocess.run(['sudo', 'mkdir', '-p', str(log_dir)],
                              check=True, capture_output=True)
                 # Try to set ownership to current user
-                import pwd
-                username = pwd.getpwuid(os.getuid()).pw_name
+                username = getpass.getuser()
                 subprocess.run(['sudo', 'chown', '-R', f'{username}:{username}', str(log_dir)],
                              check=False, capture_output=True)
                 subprocess.run(['sudo', 'chmod', '775', str(log_dir)],
@@ -254,7 +522,7 @@ class MISPLogger:
                 # If sudo also fails, print warning and skip file logging
                 print(f"⚠️  Could not create log directory {log_dir}: {e}")
                 print("⚠️  File logging disabled - console only")
-                return
+                return False
 
         # Set appropriate permissions (if needed - ACLs may already handle this)
         try:
@@ -267,13 +535,28 @@ class MISPLogger:
             # Log only unexpected errors
             print(f"⚠️  Unexpected error setting permissions on {log_dir}: {e}")
 
-        # Create rotating file handler with timestamp in filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = log_dir / f"{self.script_name}-{timestamp}.log"
+        return True
+
+    def _setup_file_handler(self):
+        """Setup rotating file handler with JSON formatting - with graceful fallback"""
+
+        log_dir = LogConfig.LOG_DIR
+        if not self._ensure_log_dir(log_dir):
+            return
+
+        # One file per script so size-based rotation actually applies across runs
+        log_file = log_dir / f"{self.script_name}.log"
+
+        # Reuse the handler (and its listener thread) if this file is already open
+        cache_key = (str(log_file), LogConfig.MAX_BYTES, LogConfig.BACKUP_COUNT)
+        shared_handler = MISPLogger._HANDLER_CACHE.get(cache_key)
+        if shared_handler is not None:
+            self.logger.addHandler(shared_handler)
+            return
 
         try:
             # Create file handler
-            file_handler = logging.handlers.RotatingFileHandler(
+            file_handler = BatchedRotatingFileHandler(
                 log_file,
                 maxBytes=LogConfig.MAX_BYTES,
                 backupCount=LogConfig.BACKUP_COUNT,
@@ -284,7 +567,16 @@ class MISPLogger:
             file_handler.setFormatter(CIMJSONFormatter())
             file_handler.setLevel(logging.DEBUG)
 
-            self.logger.addHandler(file_handler)
+            # JSON formatting and disk writes run on a listener thread; the
+            # calling thread only enqueues the record
+            log_queue = queue.Queue(-1)
+            listener = CIMQueueListener(log_queue, file_handler, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)
+
+            queue_handler = CIMQueueHandler(log_queue)
+            MISPLogger._HANDLER_CACHE[cache_key] = queue_handler
+            self.logger.addHandler(queue_handler)
         except Exception as e:
             print(f"⚠️  Could not create log file {log_file}: {e}")
             print("⚠️  File logging disabled - console only")
@@ -298,35 +590,18 @@ class MISPLogger:
 
         self.logger.addHandler(console_handler)
 
-    def _log(self, level: int, message: str, **kwargs):
+    def _log(self, level: int, message: str, status: str, **kwargs):
         """Internal logging method with extra fields"""
 
-        # Create extra fields dict
-        extra_fields = {
-            CIMFields.EVENT_ID: kwargs.pop('event_id', None),
-            CIMFields.EVENT_TYPE: kwargs.pop('event_type', None),
-            CIMFields.ACTION: kwargs.pop('action', None),
-            CIMFields.STATUS: kwargs.pop('status', None),
-            CIMFields.COMPONENT: kwargs.pop('component', None),
-            CIMFields.PHASE: kwargs.pop('phase', None),
-            CIMFields.DURATION: kwargs.pop('duration', None),
-            CIMFields.BYTES: kwargs.pop('bytes', None),
-            CIMFields.COUNT: kwargs.pop('count', None),
-            CIMFields.ERROR_CODE: kwargs.pop('error_code', None),
-            CIMFields.ERROR_MESSAGE: kwargs.pop('error_message', None),
-            CIMFields.FILE_PATH: kwargs.pop('file_path', None),
-            CIMFields.FILE_SIZE: kwargs.pop('file_size', None),
-            CIMFields.CONTAINER: kwargs.pop('container', None),
-            CIMFields.IMAGE: kwargs.pop('image', None),
-            CIMFields.BACKUP_TYPE: kwargs.pop('backup_type', None),
-            CIMFields.BACKUP_NAME: kwargs.pop('backup_name', None),
-        }
-
-        # Remove None values
-        extra_fields = {k: v for k, v in extra_fields.items() if v is not None}
-
-        # Add any remaining kwargs
-        extra_fields.update(kwargs)
+        if not kwargs:
+            # Plain message - nothing to map or filter
+            extra_fields = {_STATUS: status}
+        else:
+            # Map known keywords to CIM field names in one pass, dropping unset
+            # values; unknown keywords pass through under their own name
+            kw_to_cim = MISPLogger._KW_TO_CIM
+            extra_fields = {kw_to_cim.get(k, k): v for k, v in kwargs.items() if v is not None}
+            extra_fields[_STATUS] = status
 
         # Add sourcetype
         extra = {
@@ -336,51 +611,193 @@ class MISPLogger:
 
         self.logger.log(level, message, extra=extra)
 
+    # debug/info/success/warning check the logger level first so nothing is
+    # built for filtered-out calls. The logger itself runs at DEBUG (the file
+    # handler records everything); raise it with self.logger.setLevel() to
+    # make these calls free.
+
+    def debug(self, message: str, **kwargs):
+        """Log debug message"""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, message, 'debug', **kwargs)
+
+    def info(self, message: str, **kwargs):
+        """Log info message"""
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, message, 'info', **kwargs)
+
+    def success(self, message: str, **kwargs):
+        """Log success message"""
+        # Map SUCCESS to INFO level but with success status
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, message, 'success', **kwargs)
+
+    def warning(self, message: str, **kwargs):
+        """Log warning message"""
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._log(logging.WARNING, message, 'warning', **kwargs)
+
+    def error(self, message: str, **kwargs):
+        """Log error message"""
+        self._log(logging.ERROR, message, 'error', **kwargs)
+
+    def critical(self, message: str, **kwargs):
+        """Log critical message"""
+        self._log(logging.CRITICAL, message, 'critical', **kwargs)
+
+
+# ==========================================
+# structlog Backend (opt-in)
+# ==========================================
+
+class MISPStructLogger:
+    """
+    structlog-backed variant of MISPLogger for high-volume logging.
+
+    Same level methods and CIM JSON fields as MISPLogger, but file output goes
+    through a prebuilt structlog processor chain straight to the log file - no
+    LogRecord, handler walk or Formatter dispatch per call. Console output
+    still uses the stdlib colored console handler.
+
+    The file ({script_name}.structlog.log) is separate from the stdlib
+    backend's rotated {script_name}.log, is opened in append mode and is not
+    size-rotated.
+
+    Usage:
+        logger = get_logger('bulk-import', 'misp:import', backend='structlog')
+        logger.info("Imported batch", count=500)
+    """
+
+    __slots__ = ('script_name', 'sourcetype', 'logger', '_bound', '_console')
+
+    def __init__(self, script_name: str, sourcetype: str = 'misp:script',
+                 log_to_file: bool = True, log_to_console: bool = True):
+        self.script_name = script_name
+        self.sourcetype = sourcetype
+        self._bound = None
+
+        # Console output reuses MISPLogger's console handler (no file handler)
+        self._console = MISPLogger(script_name, sourcetype, log_to_file=False,
+                                   log_to_console=log_to_console)
+        self.logger = self._console.logger
+
+        if log_to_file:
+            self._setup_file_logger()
+
+    def _setup_file_logger(self):
+        """Build the structlog processor chain writing JSON lines to the log file"""
+
+        log_dir = LogConfig.LOG_DIR
+        if not MISPLogger._ensure_log_dir(log_dir):
+            return
+
+        # Not {script_name}.log: the stdlib backend rotates that file, and a
+        # rename would leave this handle writing to the rotated copy
+        log_file = log_dir / f"{self.script_name}.structlog.log"
+        try:
+            if HAS_ORJSON:
+                # orjson returns bytes, so pair it with a bytes logger
+                output = structlog.BytesLogger(open(log_file, 'ab'))
+                renderer = structlog.processors.JSONRenderer(
+                    serializer=lambda event, **kw: orjson.dumps(event, default=_json_default))
+            else:
+                output = structlog.WriteLogger(open(log_file, 'a', encoding='utf-8'))
+                renderer = structlog.processors.JSONRenderer(
+                    serializer=lambda event, **kw: json.dumps(event, default=_json_default))
+        except Exception as e:
+            print(f"⚠️  Could not create log file {log_file}: {e}")
+            print("⚠️  File logging disabled - console only")
+            return
+
+        base = CIMJSONFormatter()._base
+        source = self.script_name
+        sourcetype = self.sourcetype
+
+        def add_cim_fields(_logger, method_name, event_dict):
+            """Lay the event out in the same key order as CIMJSONFormatter"""
+            entry = base.copy()
+            entry[_TIMESTAMP] = _iso_utc(time.time())
+            entry[_SOURCE] = source
+            entry[_SOURCETYPE] = sourcetype
+            entry[_SEVERITY] = method_name.upper()
+            entry[_MESSAGE] = event_dict.pop('event')
+            entry.update(event_dict)
+            return entry
+
+        self._bound = structlog.wrap_logger(
+            output,
+            processors=[add_cim_fields, renderer],
+            wrapper_class=structlog.make_filtering_bound_logger(logging.DEBUG),
+            cache_logger_on_first_use=True,
+        )
+
+    def _log(self, method: str, level: int, message: str, status: str, **kwargs):
+        """Send one event to the structlog file chain and the console handler"""
+
+        kw_to_cim = MISPLogger._KW_TO_CIM
+        extra_fields = {kw_to_cim.get(k, k): v for k, v in kwargs.items() if v is not None}
+        extra_fields[_STATUS] = status
+
+        if self._bound is not None:
+            getattr(self._bound, method)(message, **extra_fields)
+
+        if self.logger.handlers:
+            self.logger.log(level, message, extra={'sourcetype': self.sourcetype,
+                                                   'extra_fields': extra_fields})
+
     def debug(self, message: str, **kwargs):
         """Log debug message"""
-        self._log(logging.DEBUG, message, status='debug', **kwargs)
+        self._log('debug', logging.DEBUG, message, 'debug', **kwargs)
 
     def info(self, message: str, **kwargs):
         """Log info message"""
-        self._log(logging.INFO, message, status='info', **kwargs)
+        self._log('info', logging.INFO, message, 'info', **kwargs)
 
     def success(self, message: str, **kwargs):
         """Log success message"""
         # Map SUCCESS to INFO level but with success status
-        self._log(logging.INFO, message, status='success', **kwargs)
+        self._log('info', logging.INFO, message, 'success', **kwargs)
 
     def warning(self, message: str, **kwargs):
         """Log warning message"""
-        self._log(logging.WARNING, message, status='warning', **kwargs)
+        self._log('warning', logging.WARNING, message, 'warning', **kwargs)
 
     def error(self, message: str, **kwargs):
         """Log error message"""
-        self._log(logging.ERROR, message, status='error', **kwargs)
+        self._log('error', logging.ERROR, message, 'error', **kwargs)
 
     def critical(self, message: str, **kwargs):
         """Log critical message"""
-        self._log(logging.CRITICAL, message, status='critical', **kwargs)
+        self._log('critical', logging.CRITICAL, message, 'critical', **kwargs)
 
 
 # ==========================================
 # Convenience Functions
 # ==========================================
 
-def get_logger(script_name: str, sourcetype: str = None, **kwargs) -> MISPLogger:
+def get_logger(script_name: str, sourcetype: str = None, backend: str = 'logging',
+               **kwargs) -> Union[MISPLogger, MISPStructLogger]:
     """
     Convenience function to get a configured MISP logger.
 
     Args:
         script_name: Name of the script
         sourcetype: Source type (defaults to 'misp:{script_name}')
+        backend: 'logging' (default, stdlib with rotation) or 'structlog'
+                 (MISPStructLogger; falls back to 'logging' if not installed)
         **kwargs: Additional arguments for MISPLogger
 
     Returns:
-        Configured MISPLogger instance
+        Configured MISPLogger (or MISPStructLogger) instance
     """
     if sourcetype is None:
         sourcetype = f"misp:{script_name.replace('-', '_').replace('.py', '')}"
 
+    if backend == 'structlog':
+        if HAS_STRUCTLOG:
+            return MISPStructLogger(script_name=script_name, sourcetype=sourcetype, **kwargs)
+        print("⚠️  structlog not installed - using standard logging backend")
+
     return MISPLogger(script_name=script_name, sourcetype=sourcetype, **kwargs)
 
 
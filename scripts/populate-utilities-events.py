@@ -7,15 +7,25 @@ for use with the Threat Actor Dashboard widgets.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+
+# Optional HTTP/2 client: multiplexes the concurrent requests over one TLS connection
+try:
+    import h2  # noqa: F401  (httpx's http2=True needs it)
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
 
 from lib.colors import Colors
 from lib.misp_api_helpers import get_api_key, get_misp_url
@@ -23,6 +33,94 @@ from scripts.event_templates import ENHANCED_TAGS_BY_EVENT, EVENT_TEMPLATES
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Events created concurrently (one /events/add request each)
+MAX_WORKERS = 8
+
+
+def create_session(api_key):
+    """Keep-alive client shared by the worker threads (HTTP/2 via httpx if available)"""
+    headers = {
+        'Authorization': api_key,
+        'Accept': 'application/json',
+        'Content-Type': 'application/json'
+    }
+    if HAS_HTTPX:
+        return httpx.Client(http2=True, verify=False, headers=headers, timeout=30)
+
+    session = requests.Session()
+    session.headers.update(headers)
+    session.verify = False
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def create_event(session, misp_url, template, today):
+    """Create and publish one event with its attributes
+
+    Returns (outcome, line) where outcome is 'created', 'skipped' or 'failed'.
+    """
+    event_num = template['number']
+
+    # Calculate event date (distributed over last 20 days)
+    days_ago = template['days_ago']
+    event_date = (today - timedelta(days=days_ago)).isoformat()
+
+    # Get enhanced tags (includes threat-actor tags)
+    enhanced_tags = ENHANCED_TAGS_BY_EVENT.get(event_num, template['tags'])
+
+    attributes = template.get('attributes') or []
+
+    # Build event payload with its attributes so one request creates and
+    # publishes it (MISP won't accept published empty events)
+    event_payload = {
+        "Event": {
+            "info": template['info'],
+            "threat_level_id": 2,  # Medium
+            "analysis": 1,  # Initial
+            "distribution": 3,  # All communities
+            "date": event_date,
+            "published": bool(attributes),
+            "Tag": enhanced_tags,
+            "Attribute": attributes
+        }
+    }
+
+    try:
+        # Create event via API
+        response = session.post(
+            f"{misp_url}/events/add",
+            json=event_payload,
+            timeout=30
+        )
+
+        if response.status_code in [200, 201]:
+            result = response.json()
+            event_id = result.get('Event', {}).get('id', 'unknown')
+
+            # Events without attributes are created unpublished; publish them now
+            if not attributes:
+                session.post(
+                    f"{misp_url}/events/publish/{event_id}",
+                    timeout=10
+                )
+
+            return 'created', f"{Colors.success('✓')} Event {event_num}: {template['info'][:60]}... (ID: {event_id})"
+
+        elif response.status_code == 403:
+            return 'failed', f"{Colors.warning('⚠')} Event {event_num}: Permission denied (403)"
+
+        elif response.status_code == 400:
+            # Might already exist
+            return 'skipped', f"{Colors.info('→')} Event {event_num}: Already exists or validation error"
+
+        else:
+            return 'failed', f"{Colors.error('✗')} Event {event_num}: Failed ({response.status_code})"
+
+    except Exception as e:
+        return 'failed', f"{Colors.error('✗')} Event {event_num}: Error - {str(e)[:50]}"
+
 
 def create_events():
     """Create all 31 ICS/OT events with threat-actor tags"""
@@ -35,11 +133,7 @@ def create_events():
         print(Colors.error("✗ Could not get MISP API credentials"))
         return False
 
-    headers = {
-        'Authorization': api_key,
-        'Accept': 'application/json',
-        'Content-Type': 'application/json'
-    }
+    session = create_session(api_key)
 
     print("\n" + "="*60)
     print(Colors.info("POPULATING ICS/OT THREAT INTELLIGENCE EVENTS"))
@@ -52,87 +146,22 @@ def create_events():
     skipped_count = 0
     failed_count = 0
 
-    for template in EVENT_TEMPLATES:
-        event_num = template['number']
-
-        # Calculate event date (distributed over last 20 days)
-        days_ago = template['days_ago']
-        event_date = (datetime.now() - timedelta(days=days_ago)).strftime('%Y-%m-%d')
-
-        # Get enhanced tags (includes threat-actor tags)
-        enhanced_tags = ENHANCED_TAGS_BY_EVENT.get(event_num, template['tags'])
-
-        # Build event payload (unpublished initially - MISP won't accept published empty events)
-        event_payload = {
-            "Event": {
-                "info": template['info'],
-                "threat_level_id": 2,  # Medium
-                "analysis": 1,  # Initial
-                "distribution": 3,  # All communities
-                "date": event_date,
-                "published": False,  # Create unpublished, then publish after adding attributes
-                "Tag": enhanced_tags
-            }
-        }
+    # One reference date for every template
+    today = date.today()
 
-        try:
-            # Create event via API
-            response = requests.post(
-                f"{misp_url}/events/add",
-                headers=headers,
-                json=event_payload,
-                verify=False,
-                timeout=30
-            )
-
-            if response.status_code in [200, 201]:
-                result = response.json()
-                event_id = result.get('Event', {}).get('id', 'unknown')
+    # Results come back in template order, so the output reads as before
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = executor.map(lambda t: create_event(session, misp_url, t, today), EVENT_TEMPLATES)
+        for outcome, line in results:
+            print(line)
+            if outcome == 'created':
                 created_count += 1
-
-                # Add attributes if specified
-                if 'attributes' in template and template['attributes']:
-                    for attr in template['attributes']:
-                        attr_payload = {
-                            "Attribute": {
-                                **attr,
-                                "event_id": event_id
-                            }
-                        }
-                        requests.post(
-                            f"{misp_url}/attributes/add/{event_id}",
-                            headers=headers,
-                            json=attr_payload,
-                            verify=False,
-                            timeout=10
-                        )
-
-                # Publish the event now that it has attributes/tags
-                requests.post(
-                    f"{misp_url}/events/publish/{event_id}",
-                    headers=headers,
-                    verify=False,
-                    timeout=10
-                )
-
-                print(f"{Colors.success('✓')} Event {event_num}: {template['info'][:60]}... (ID: {event_id})")
-
-            elif response.status_code == 403:
-                print(f"{Colors.warning('⚠')} Event {event_num}: Permission denied (403)")
-                failed_count += 1
-
-            elif response.status_code == 400:
-                # Might already exist
-                print(f"{Colors.info('→')} Event {event_num}: Already exists or validation error")
+            elif outcome == 'skipped':
                 skipped_count += 1
-
             else:
-                print(f"{Colors.error('✗')} Event {event_num}: Failed ({response.status_code})")
                 failed_count += 1
 
-        except Exception as e:
-            print(f"{Colors.error('✗')} Event {event_num}: Error - {str(e)[:50]}")
-            failed_count += 1
+    session.close()
 
     print()
     print("="*60)
@@ -24,7 +24,7 @@ import time
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from lib.colors import Colors
-from lib.docker_helpers import is_container_running
+from lib.docker_helpers import DockerShell, is_container_running
 
 
 def print_header(title):
@@ -47,28 +47,27 @@ def check_prerequisites():
     return True
 
 
-def remove_all_widgets(dry_run=False):
+def remove_all_widgets(shell, dry_run=False):
     """Remove all custom widgets from MISP container"""
     print_header("REMOVING ALL CUSTOM WIDGETS")
 
     widget_dir = "/var/www/MISP/app/Lib/Dashboard/Custom"
 
-    # List all PHP files in Custom directory
-    result = subprocess.run(
-        ['sudo', 'docker', 'exec', 'misp-misp-core-1',
-         'find', widget_dir, '-name', '*.php'],
-        capture_output=True,
-        text=True,
-        timeout=30
-    )
+    # List and delete all PHP files in the Custom directory with one docker exec
+    # (a dry run only lists them)
+    find_args = ['find', widget_dir, '-name', '*.php', '-print']
+    if not dry_run:
+        find_args.append('-delete')
 
-    if result.returncode != 0:
-        print(Colors.error(f"✗ Failed to list widgets: {result.stderr}"))
-        return False
+    returncode, stdout, stderr = shell.run(find_args, timeout=30)
 
-    widget_files = result.stdout.strip().split('\n')
+    widget_files = stdout.strip().split('\n')
     widget_files = [f for f in widget_files if f]  # Remove empty strings
 
+    if returncode != 0 and not widget_files:
+        print(Colors.error(f"✗ Failed to list widgets: {stderr}"))
+        return False
+
     if not widget_files:
         print(Colors.warning("⚠ No widgets found (directory may be empty)"))
         return True
@@ -82,28 +81,34 @@ def remove_all_widgets(dry_run=False):
         print(Colors.warning("\n[DRY RUN] Would remove all widgets (not actually removing)"))
         return True
 
-    # Remove all widget files
     print("\nRemoving widgets...")
     removed_count = 0
     failed_count = 0
 
+    # A file counts as removed only if it is gone afterwards; find's stderr is
+    # locale-dependent (quote style), so it is only used for the error text
+    check_rc, stdout, check_err = shell.run(
+        ['sh', '-c', 'for f in "$@"; do [ -e "$f" ] && echo "$f"; done; true', 'sh', *widget_files],
+        timeout=30
+    )
+    if check_rc == 0:
+        remaining = set(stdout.splitlines())
+    else:
+        # Can't tell what was deleted, so don't report anything as removed
+        remaining = set(widget_files)
+        stderr = f"{stderr}\n{check_err}"
+    error_lines = stderr.splitlines()
+
     for widget_file in widget_files:
         widget_name = os.path.basename(widget_file)
 
-        result = subprocess.run(
-            ['sudo', 'docker', 'exec', 'misp-misp-core-1',
-             'rm', widget_file],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-
-        if result.returncode == 0:
+        if widget_file not in remaining:
             removed_count += 1
             print(Colors.success(f"✓ Removed {widget_name}"))
         else:
             failed_count += 1
-            print(Colors.error(f"✗ Failed to remove {widget_name}: {result.stderr}"))
+            error = next((line for line in error_lines if widget_file in line), "still present")
+            print(Colors.error(f"✗ Failed to remove {widget_name}: {error}"))
 
     print("\nSummary:")
     print(f"  ✓ Removed: {removed_count}")
@@ -112,21 +117,18 @@ def remove_all_widgets(dry_run=False):
     return failed_count == 0
 
 
-def clear_php_cache():
+def clear_php_cache(shell):
     """Clear PHP OpCache to ensure fresh widget loading"""
     print_header("CLEARING PHP CACHE")
 
     # Clear PHP OpCache
-    result = subprocess.run(
-        ['sudo', 'docker', 'exec', 'misp-misp-core-1',
-         'rm', '-rf', '/var/www/MISP/app/tmp/cache/*'],
-        capture_output=True,
-        text=True,
+    returncode, _, stderr = shell.run(
+        ['rm', '-rf', '/var/www/MISP/app/tmp/cache/*'],
         timeout=30
     )
 
-    if result.returncode != 0:
-        print(Colors.warning(f"⚠ Failed to clear cache: {result.stderr}"))
+    if returncode != 0:
+        print(Colors.warning(f"⚠ Failed to clear cache: {stderr}"))
         print("  (This may not be critical)")
     else:
         print(Colors.success("✓ PHP cache cleared"))
@@ -202,7 +204,7 @@ def _run_install_script(script_path):
     return result.returncode == 0
 
 
-def remove_abstract_classes():
+def remove_abstract_classes(shell):
     """Remove abstract base classes that cause instantiation errors"""
     print_header("REMOVING ABSTRACT BASE CLASSES")
 
@@ -216,30 +218,19 @@ def remove_abstract_classes():
 
     removed_count = 0
 
-    for abstract_class in abstract_classes:
-        class_path = f"{widget_dir}/{abstract_class}"
-
-        # Check if exists
-        check_result = subprocess.run(
-            ['sudo', 'docker', 'exec', 'misp-misp-core-1',
-             'test', '-f', class_path],
-            capture_output=True,
-            timeout=5
-        )
-
-        if check_result.returncode == 0:  # File exists
-            # Remove it
-            result = subprocess.run(
-                ['sudo', 'docker', 'exec', 'misp-misp-core-1',
-                 'rm', class_path],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+    # Check and remove every class in one command; the names go in as
+    # arguments and each file actually removed is echoed back
+    _, stdout, _ = shell.run(
+        ['sh', '-c',
+         'cd "$0" || exit 0; for f in "$@"; do [ -f "$f" ] && rm "$f" && echo "REMOVED:$f"; done',
+         widget_dir, *abstract_classes],
+        timeout=10
+    )
 
-            if result.returncode == 0:
-                removed_count += 1
-                print(Colors.success(f"✓ Removed: {abstract_class}"))
+    for line in stdout.splitlines():
+        if line.startswith('REMOVED:'):
+            removed_count += 1
+            print(Colors.success(f"✓ Removed: {line[len('REMOVED:'):]}"))
 
     if removed_count > 0:
         print(Colors.success(f"\n✓ Removed {removed_count} abstract base class(es)"))
@@ -249,7 +240,7 @@ def remove_abstract_classes():
     return True
 
 
-def apply_widget_fixes():
+def apply_widget_fixes(shell):
     """Apply wildcard and timeframe fixes to widgets"""
     print_header("APPLYING WIDGET FIXES")
 
@@ -284,15 +275,12 @@ def apply_widget_fixes():
     for widget in widgets_to_fix:
         widget_path = f"{widget_dir}/{widget}"
 
-        result = subprocess.run(
-            ['sudo', 'docker', 'exec', 'misp-misp-core-1',
-             'sed', '-i', "s/'ics:'/'ics:%'/g", widget_path],
-            capture_output=True,
-            text=True,
+        returncode, _, _ = shell.run(
+            ['sed', '-i', "s/'ics:'/'ics:%'/g", widget_path],
             timeout=10
         )
 
-        if result.returncode == 0:
+        if returncode == 0:
             fixed_count += 1
 
     print(Colors.success(f"✓ Applied wildcard fixes to {fixed_count}/{len(widgets_to_fix)} widgets"))
@@ -314,14 +302,12 @@ def apply_widget_fixes():
         widget_path = f"{widget_dir}/{widget}"
 
         # Check for correct day format (365d, 3650d)
-        result = subprocess.run(
-            ['sudo', 'docker', 'exec', 'misp-misp-core-1',
-             'grep', '-q', '"timeframe": ".*d"', widget_path],
-            capture_output=True,
+        returncode, _, _ = shell.run(
+            ['grep', '-q', '"timeframe": ".*d"', widget_path],
             timeout=10
         )
 
-        if result.returncode == 0:
+        if returncode == 0:
             format_ok += 1
             print(Colors.success(f"✓ {widget}: Correct format (day-based)"))
         else:
@@ -370,26 +356,23 @@ def restart_misp():
     return True
 
 
-def verify_widgets():
+def verify_widgets(shell):
     """Verify that widgets were installed correctly"""
     print_header("VERIFYING WIDGET INSTALLATION")
 
     widget_dir = "/var/www/MISP/app/Lib/Dashboard/Custom"
 
     # Count widgets
-    result = subprocess.run(
-        ['sudo', 'docker', 'exec', 'misp-misp-core-1',
-         'find', widget_dir, '-name', '*.php', '-type', 'f'],
-        capture_output=True,
-        text=True,
+    returncode, stdout, stderr = shell.run(
+        ['find', widget_dir, '-name', '*.php', '-type', 'f'],
         timeout=30
     )
 
-    if result.returncode != 0:
-        print(Colors.error(f"✗ Failed to verify widgets: {result.stderr}"))
+    if returncode != 0:
+        print(Colors.error(f"✗ Failed to verify widgets: {stderr}"))
         return False
 
-    widget_files = result.stdout.strip().split('\n')
+    widget_files = stdout.strip().split('\n')
     widget_files = [f for f in widget_files if f]
     widget_count = len(widget_files)
 
@@ -412,14 +395,9 @@ def verify_widgets():
     for widget in threat_actor_widgets:
         widget_path = f"{widget_dir}/{widget}"
 
-        result = subprocess.run(
-            ['sudo', 'docker', 'exec', 'misp-misp-core-1',
-             'test', '-f', widget_path],
-            capture_output=True,
-            timeout=5
-        )
+        returncode, _, _ = shell.run(['test', '-f', widget_path], timeout=5)
 
-        if result.returncode == 0:
+        if returncode == 0:
             print(Colors.success(f"  ✓ {widget}"))
         else:
             print(Colors.error(f"  ✗ {widget} NOT FOUND"))
@@ -500,35 +478,38 @@ def main():
         if not check_prerequisites():
             sys.exit(1)
 
-        # Remove all widgets
-        if not remove_all_widgets(dry_run=args.dry_run):
-            print(Colors.error("\n✗ Widget removal failed"))
-            sys.exit(1)
+        # One shell inside the container serves every step up to the restart
+        with DockerShell('misp-misp-core-1') as shell:
+            # Remove all widgets
+            if not remove_all_widgets(shell, dry_run=args.dry_run):
+                print(Colors.error("\n✗ Widget removal failed"))
+                sys.exit(1)
 
-        if args.dry_run:
-            print_summary()
-            return
+            if args.dry_run:
+                print_summary()
+                return
 
-        # Clear PHP cache
-        clear_php_cache()
+            # Clear PHP cache
+            clear_php_cache(shell)
 
-        # Reinstall widgets
-        if not reinstall_widgets(dry_run=args.dry_run):
-            print(Colors.error("\n✗ Widget reinstallation failed"))
-            sys.exit(1)
+            # Reinstall widgets
+            if not reinstall_widgets(dry_run=args.dry_run):
+                print(Colors.error("\n✗ Widget reinstallation failed"))
+                sys.exit(1)
 
-        # Remove abstract classes
-        remove_abstract_classes()
+            # Remove abstract classes
+            remove_abstract_classes(shell)
 
-        # Apply fixes
-        apply_widget_fixes()
+            # Apply fixes
+            apply_widget_fixes(shell)
 
         # Restart MISP
         if not restart_misp():
             print(Colors.warning("\n⚠ MISP restart had issues, but widgets may be OK"))
 
-        # Verify installation
-        verify_widgets()
+        # Verify installation (the restart ended the earlier shell)
+        with DockerShell('misp-misp-core-1') as shell:
+            verify_widgets(shell)
 
         # Print summary
         print_summary()
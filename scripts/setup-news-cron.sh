@@ -112,7 +112,7 @@ install_cron() {
     echo "  • Check RSS feeds for new articles (last 2 days)"
     echo "  • Add utilities/energy sector news to MISP"
     echo "  • Skip duplicates automatically"
-    echo "  • Log to: /opt/misp/logs/populate-misp-news-*.log"
+    echo "  • Log to: /opt/misp/logs/populate-misp-news.log"
     echo ""
     echo "Manual run:"
     echo "  python3 $PROJECT_DIR/scripts/populate-misp-news.py"
@@ -108,7 +108,7 @@ class TestLogRotation:
             assert len(logger.handlers) > 0
 
     def test_log_file_naming(self):
-        """Test that log files use timestamp naming convention."""
+        """Test that log files use the per-script naming convention."""
         from misp_logger import get_logger
 
         with patch('misp_logger.Path') as mock_path:
@@ -117,7 +117,7 @@ class TestLogRotation:
             logger = get_logger('test-naming', 'misp:test')
 
             # Log file name should include script name
-            # Format: {script-name}-{timestamp}.log
+            # Format: {script-name}.log (rotated by size)
             assert logger is not None
 
 
@@ -0,0 +1,47 @@
+"""
+Unit tests for MISP news population.
+
+Tests the utilities keyword filter from scripts/populate-misp-news.py
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("feedparser")
+
+_spec = importlib.util.spec_from_file_location(
+    "populate_misp_news",
+    Path(__file__).parent.parent / "scripts" / "populate-misp-news.py",
+)
+populate_misp_news = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(populate_misp_news)
+
+
+class TestKeywordFilter:
+    """Test suite for the utilities keyword filter."""
+
+    @pytest.mark.parametrize("headline", [
+        "New SCADA flaw disclosed",
+        "Vulnerabilities in Siemens PLCs",
+        "Attackers target home routers",
+        "Microsoft patches actively exploited bug",
+        "Ransomware hits substations and transformers",
+        "Critical infrastructure networks under attack",
+    ])
+    def test_relevant_headlines_match(self, headline):
+        """Test that keywords match in singular and plural form."""
+        assert populate_misp_news._has_keyword(headline)
+
+    @pytest.mark.parametrize("headline", [
+        "Botnet topics of the week",
+        "What the new law does for consumers",
+    ])
+    def test_keywords_inside_words_do_not_match(self, headline):
+        """Test that short keywords don't match inside other words."""
+        assert not populate_misp_news._has_keyword(headline)